@@ -0,0 +1,20 @@
+import pytest
+
+from dagster import DagsterInstance
+from dagster.core.instance import InstanceRef
+from dagster.utils import file_relative_path
+
+
+@pytest.fixture(scope="session")
+def logging_config_dir():
+    return file_relative_path(__file__, "../../../docs_snippets/concepts/logging")
+
+
+@pytest.fixture(scope="session")
+def instance_for(logging_config_dir):  # pylint: disable=redefined-outer-name
+    def _instance_for(config_filename):
+        return DagsterInstance.from_ref(
+            InstanceRef.from_dir(base_dir=logging_config_dir, config_filename=config_filename)
+        )
+
+    return _instance_for
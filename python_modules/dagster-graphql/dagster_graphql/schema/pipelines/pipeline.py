@@ -42,6 +42,7 @@
     GrapheneSolidHandle,
     build_solid_handles,
     build_solids,
+    build_sorted_solid_handles,
 )
 from ..tags import GraphenePipelineTag
 from ..util import non_null_list
@@ -542,19 +543,9 @@ def resolve_solid_handle(self, _graphene_info, handleID):
         return build_solid_handles(self.get_represented_pipeline()).get(handleID)
 
     def resolve_solid_handles(self, _graphene_info, **kwargs):
-        handles = build_solid_handles(self.get_represented_pipeline())
-        parentHandleID = kwargs.get("parentHandleID")
-
-        if parentHandleID == "":
-            handles = {key: handle for key, handle in handles.items() if not handle.parent}
-        elif parentHandleID is not None:
-            handles = {
-                key: handle
-                for key, handle in handles.items()
-                if handle.parent and handle.parent.handleID.to_string() == parentHandleID
-            }
-
-        return [handles[key] for key in sorted(handles)]
+        return build_sorted_solid_handles(
+            self.get_represented_pipeline(), kwargs.get("parentHandleID")
+        )
 
     def resolve_tags(self, _graphene_info):
         represented_pipeline = self.get_represented_pipeline()
@@ -794,19 +785,7 @@ def resolve_solid_handle(self, _graphene_info, handleID):
         return build_solid_handles(self._external_pipeline).get(handleID)
 
     def resolve_solid_handles(self, _graphene_info, **kwargs):
-        handles = build_solid_handles(self._external_pipeline)
-        parentHandleID = kwargs.get("parentHandleID")
-
-        if parentHandleID == "":
-            handles = {key: handle for key, handle in handles.items() if not handle.parent}
-        elif parentHandleID is not None:
-            handles = {
-                key: handle
-                for key, handle in handles.items()
-                if handle.parent and handle.parent.handleID.to_string() == parentHandleID
-            }
-
-        return [handles[key] for key in sorted(handles)]
+        return build_sorted_solid_handles(self._external_pipeline, kwargs.get("parentHandleID"))
 
     def resolve_modes(self, _graphene_info):
         # returns empty list... graphs don't have modes, this is a vestige of the old
@@ -1,4 +1,4 @@
-from functools import lru_cache
+from functools import wraps
 
 import graphene
 from dagster_graphql.implementation.events import iterate_metadata_entries
@@ -23,6 +23,18 @@ class _ArgNotPresentSentinel:
     pass
 
 
+def _memoize_on_pipeline(fn):
+    # The graphene objects built here are immutable views over the represented pipeline, so they
+    # are memoized on the pipeline itself and released along with it.
+    @wraps(fn)
+    def _memoized(represented_pipeline, *args):
+        return represented_pipeline.get_memoized(
+            (fn.__name__, *args), lambda: fn(represented_pipeline, *args)
+        )
+
+    return _memoized
+
+
 class GrapheneInputDefinition(graphene.ObjectType):
     solid_definition = graphene.NonNull(lambda: GrapheneSolidDefinition)
     name = graphene.NonNull(graphene.String)
@@ -39,8 +51,10 @@ def __init__(self, represented_pipeline, solid_def_name, input_def_name):
         )
         check.str_param(solid_def_name, "solid_def_name")
         check.str_param(input_def_name, "input_def_name")
-        solid_def_snap = self._represented_pipeline.get_node_def_snap(solid_def_name)
-        self._input_def_snap = solid_def_snap.get_input_snap(input_def_name)
+        self._solid_def_snap = self._represented_pipeline.get_node_def_snap(solid_def_name)
+        self._input_def_snap = self._represented_pipeline.get_input_def_snap(
+            solid_def_name, input_def_name
+        )
         super().__init__(
             name=self._input_def_snap.name,
             description=self._input_def_snap.description,
@@ -52,9 +66,7 @@ def resolve_type(self, _graphene_info):
         )
 
     def resolve_solid_definition(self, _graphene_info):
-        return build_solid_definition(
-            self._represented_pipeline, self._solid_def_snap.name  # pylint: disable=no-member
-        )
+        return build_solid_definition(self._represented_pipeline, self._solid_def_snap.name)
 
     def resolve_metadata_entries(self, _graphene_info):
         return list(iterate_metadata_entries(self._input_def_snap.metadata_entries))
@@ -79,7 +91,9 @@ def __init__(self, represented_pipeline, solid_def_name, output_def_name, is_dyn
         check.str_param(output_def_name, "output_def_name")
 
         self._solid_def_snap = represented_pipeline.get_node_def_snap(solid_def_name)
-        self._output_def_snap = self._solid_def_snap.get_output_snap(output_def_name)
+        self._output_def_snap = represented_pipeline.get_output_def_snap(
+            solid_def_name, output_def_name
+        )
 
         super().__init__(
             name=self._output_def_snap.name,
@@ -100,6 +114,18 @@ def resolve_metadata_entries(self, _graphene_info):
         return list(iterate_metadata_entries(self._output_def_snap.metadata_entries))
 
 
+@_memoize_on_pipeline
+def build_input_definition(represented_pipeline, solid_def_name, input_def_name):
+    return GrapheneInputDefinition(represented_pipeline, solid_def_name, input_def_name)
+
+
+@_memoize_on_pipeline
+def build_output_definition(represented_pipeline, solid_def_name, output_def_name, is_dynamic):
+    return GrapheneOutputDefinition(
+        represented_pipeline, solid_def_name, output_def_name, is_dynamic
+    )
+
+
 class GrapheneInput(graphene.ObjectType):
     solid = graphene.NonNull(lambda: GrapheneSolid)
     definition = graphene.NonNull(GrapheneInputDefinition)
@@ -119,23 +145,18 @@ def __init__(self, represented_pipeline, current_dep_structure, solid_name, inpu
         self._solid_name = check.str_param(solid_name, "solid_name")
         self._input_name = check.str_param(input_name, "input_name")
         self._solid_invocation_snap = current_dep_structure.get_invocation(solid_name)
-        self._solid_def_snap = represented_pipeline.get_node_def_snap(
-            self._solid_invocation_snap.solid_def_name
-        )
-        self._input_def_snap = self._solid_def_snap.get_input_snap(input_name)
-
         super().__init__()
 
     def resolve_solid(self, _graphene_info):
-        return GrapheneSolid(
+        return build_solid(
             self._represented_pipeline, self._solid_name, self._current_dep_structure
         )
 
     def resolve_definition(self, _graphene_info):
-        return GrapheneInputDefinition(
+        return build_input_definition(
             self._represented_pipeline,
-            self._solid_def_snap.name,
-            self._input_def_snap.name,
+            self._solid_invocation_snap.solid_def_name,
+            self._input_name,
         )
 
     def resolve_depends_on(self, _graphene_info):
@@ -173,23 +194,25 @@ def __init__(self, represented_pipeline, current_dep_structure, solid_name, outp
         self._solid_name = check.str_param(solid_name, "solid_name")
         self._output_name = check.str_param(output_name, "output_name")
         self._solid_invocation_snap = current_dep_structure.get_invocation(solid_name)
-        self._solid_def_snap = represented_pipeline.get_node_def_snap(
-            self._solid_invocation_snap.solid_def_name
-        )
-        self._output_def_snap = self._solid_def_snap.get_output_snap(output_name)
         super().__init__()
 
     def resolve_solid(self, _):
-        return GrapheneSolid(
+        return build_solid(
             self._represented_pipeline, self._solid_name, self._current_dep_structure
         )
 
     def resolve_definition(self, _graphene_info):
-        return GrapheneOutputDefinition(
+        # Outputs are built in bulk when traversing dependencies, so the definition snapshots are
+        # only looked up once a query actually asks for the definition.
+        solid_def_name = self._solid_invocation_snap.solid_def_name
+        output_def_snap = self._represented_pipeline.get_output_def_snap(
+            solid_def_name, self._output_name
+        )
+        return build_output_definition(
             self._represented_pipeline,
-            self._solid_def_snap.name,
+            solid_def_name,
             self._output_name,
-            self._output_def_snap.is_dynamic,
+            output_def_snap.is_dynamic,
         )
 
     def resolve_depended_by(self, _graphene_info):
@@ -201,7 +224,7 @@ def resolve_depended_by(self, _graphene_info):
                 input_handle_snap.input_name,
             )
             for input_handle_snap in self._current_dep_structure.get_downstream_inputs(
-                self._solid_name, self._output_def_snap.name
+                self._solid_name, self._output_name
             )
         ]
 
@@ -227,7 +250,9 @@ def __init__(
             current_dep_index, "current_dep_index", DependencyStructureIndex
         )
         self._solid_def_snap = represented_pipeline.get_node_def_snap(solid_def_name)
-        self._input_mapping_snap = self._solid_def_snap.get_input_mapping_snap(input_name)
+        self._input_mapping_snap = represented_pipeline.get_input_mapping_snap(
+            solid_def_name, input_name
+        )
         super().__init__()
 
     def resolve_mapped_input(self, _graphene_info):
@@ -239,7 +264,7 @@ def resolve_mapped_input(self, _graphene_info):
         )
 
     def resolve_definition(self, _graphene_info):
-        return GrapheneInputDefinition(
+        return build_input_definition(
             self._represented_pipeline,
             self._solid_def_snap.name,
             self._input_mapping_snap.external_input_name,
@@ -267,8 +292,12 @@ def __init__(
             current_dep_index, "current_dep_index", DependencyStructureIndex
         )
         self._solid_def_snap = represented_pipeline.get_node_def_snap(solid_def_name)
-        self._output_mapping_snap = self._solid_def_snap.get_output_mapping_snap(output_name)
-        self._output_def_snap = self._solid_def_snap.get_output_snap(output_name)
+        self._output_mapping_snap = represented_pipeline.get_output_mapping_snap(
+            solid_def_name, output_name
+        )
+        self._output_def_snap = represented_pipeline.get_output_def_snap(
+            solid_def_name, output_name
+        )
 
         super().__init__()
 
@@ -281,7 +310,7 @@ def resolve_mapped_output(self, _graphene_info):
         )
 
     def resolve_definition(self, _graphene_info):
-        return GrapheneOutputDefinition(
+        return build_output_definition(
             self._represented_pipeline,
             self._solid_def_snap.name,
             self._output_mapping_snap.external_output_name,
@@ -300,52 +329,77 @@ def __init__(self, resource_key):
         self.resource_key = resource_key
 
 
+@_memoize_on_pipeline
+def build_solid(represented_pipeline, solid_name, current_dep_index):
+    # The same solid is reached from handles, containers and both ends of every dependency, so
+    # share one instance per invocation.
+    return GrapheneSolid(represented_pipeline, solid_name, current_dep_index)
+
+
 def build_solids(represented_pipeline, current_dep_index):
     check.inst_param(represented_pipeline, "represented_pipeline", RepresentedPipeline)
-    return sorted(
-        [
-            GrapheneSolid(represented_pipeline, solid_name, current_dep_index)
-            for solid_name in current_dep_index.solid_invocation_names
-        ],
-        key=lambda solid: solid.name,
-    )
+    return [
+        build_solid(represented_pipeline, solid_name, current_dep_index)
+        for solid_name in sorted(current_dep_index.solid_invocation_names)
+    ]
 
 
-def _build_solid_handles(represented_pipeline, current_dep_index, parent=None):
+def _build_solid_handles(represented_pipeline, root_dep_index):
     check.inst_param(represented_pipeline, "represented_pipeline", RepresentedPipeline)
-    check.opt_inst_param(parent, "parent", GrapheneSolidHandle)
     all_handle = []
-    for solid_invocation in current_dep_index.solid_invocations:
+    # Walk the composite tree with an explicit stack. Each frame holds the remaining invocations
+    # of a graph along with the handle of the composite that contains them, which is appended
+    # once all of its children have been, preserving the order of a recursive traversal.
+    stack = [(iter(root_dep_index.solid_invocations), root_dep_index, None)]
+    while stack:
+        solid_invocations, current_dep_index, parent = stack[-1]
+        solid_invocation = next(solid_invocations, None)
+        if solid_invocation is None:
+            stack.pop()
+            if parent:
+                all_handle.append(parent)
+            continue
+
         solid_name, solid_def_name = solid_invocation.solid_name, solid_invocation.solid_def_name
         handle = GrapheneSolidHandle(
-            solid=GrapheneSolid(represented_pipeline, solid_name, current_dep_index),
+            solid=build_solid(represented_pipeline, solid_name, current_dep_index),
             handle=NodeHandle(solid_name, parent.handleID if parent else None),
             parent=parent if parent else None,
         )
         solid_def_snap = represented_pipeline.get_node_def_snap(solid_def_name)
         if isinstance(solid_def_snap, CompositeSolidDefSnap):
-            all_handle += _build_solid_handles(
-                represented_pipeline,
-                represented_pipeline.get_dep_structure_index(solid_def_name),
-                handle,
-            )
-
-        all_handle.append(handle)
+            composite_dep_index = represented_pipeline.get_dep_structure_index(solid_def_name)
+            stack.append((iter(composite_dep_index.solid_invocations), composite_dep_index, handle))
+        else:
+            all_handle.append(handle)
 
     return all_handle
 
 
-@lru_cache(maxsize=32)
+@_memoize_on_pipeline
 def build_solid_handles(represented_pipeline):
     check.inst_param(represented_pipeline, "represented_pipeline", RepresentedPipeline)
     return {
-        str(item.handleID): item
+        item.get_handle_id_str(): item
         for item in _build_solid_handles(
             represented_pipeline, represented_pipeline.dep_structure_index
         )
     }
 
 
+def build_sorted_solid_handles(represented_pipeline, parent_handle_id=None):
+    # an empty parent_handle_id selects the top-level handles, None selects all of them
+    handles = build_solid_handles(represented_pipeline)
+    return sorted(
+        (
+            handle
+            for handle in handles.values()
+            if parent_handle_id is None or handle.get_parent_handle_id_str() == parent_handle_id
+        ),
+        key=lambda handle: handle.get_handle_id_str(),
+    )
+
+
 class GrapheneISolidDefinition(graphene.Interface):
     name = graphene.NonNull(graphene.String)
     description = graphene.String()
@@ -378,7 +432,7 @@ def solid_def_name(self):
 
     def resolve_input_definitions(self, _graphene_info):
         return [
-            GrapheneInputDefinition(
+            build_input_definition(
                 self._represented_pipeline, self.solid_def_name, input_def_snap.name
             )
             for input_def_snap in self._solid_def_snap.input_def_snaps
@@ -386,7 +440,7 @@ def resolve_input_definitions(self, _graphene_info):
 
     def resolve_output_definitions(self, _graphene_info):
         return [
-            GrapheneOutputDefinition(
+            build_output_definition(
                 self._represented_pipeline,
                 self.solid_def_name,
                 output_def_snap.name,
@@ -409,12 +463,10 @@ def resolve_asset_nodes(self, graphene_info):
             origin = repo_handle.repository_location_origin
             location = graphene_info.context.get_repository_location(origin.location_name)
             ext_repo = location.get_repository(repo_handle.repository_name)
-            nodes = [
-                node
-                for node in ext_repo.get_external_asset_nodes()
-                if node.op_name == self.solid_def_name
+            return [
+                GrapheneAssetNode(location, ext_repo, node)
+                for node in ext_repo.get_external_asset_nodes_for_op(self.solid_def_name)
             ]
-            return [GrapheneAssetNode(location, ext_repo, node) for node in nodes]
 
 
 class GrapheneSolidDefinition(graphene.ObjectType, ISolidDefinitionMixin):
@@ -426,10 +478,8 @@ class Meta:
         name = "SolidDefinition"
 
     def __init__(self, represented_pipeline: RepresentedPipeline, solid_def_name: str):
-        check.inst_param(represented_pipeline, "represented_pipeline", RepresentedPipeline)
-        self._solid_def_snap = represented_pipeline.get_node_def_snap(solid_def_name)
-        super().__init__(name=solid_def_name, description=self._solid_def_snap.description)  # type: ignore
         ISolidDefinitionMixin.__init__(self, represented_pipeline, solid_def_name)
+        super().__init__(name=solid_def_name, description=self._solid_def_snap.description)  # type: ignore
 
     def resolve_config_field(self, _graphene_info):
         return (
@@ -552,6 +602,15 @@ def __init__(self, handle, solid, parent=None):
             parent=check.opt_inst_param(parent, "parent", GrapheneSolidHandle),
         )
         self._solid = solid
+        self._handle_id_str = handle.to_string()
+        # top-level handles are selected with an empty parentHandleID
+        self._parent_handle_id_str = parent.get_handle_id_str() if parent else ""
+
+    def get_handle_id_str(self):
+        return self._handle_id_str
+
+    def get_parent_handle_id_str(self):
+        return self._parent_handle_id_str
 
     def resolve_stepStats(self, _graphene_info, limit):
         if self._solid.get_is_dynamic_mapped():
@@ -567,9 +626,10 @@ def resolve_stepStats(self, _graphene_info, limit):
         instance = _graphene_info.context.instance
         runs_filter = RunsFilter(pipeline_name=self._solid.get_pipeline_name())
         runs = instance.get_runs(runs_filter, limit=limit)
+        step_keys = [self._handle_id_str]
         nodes = []
         for run in runs:
-            stats = instance.get_run_step_stats(run.run_id, [str(self.handleID)])
+            stats = instance.get_run_step_stats(run.run_id, step_keys)
             if len(stats):
                 nodes.append(GrapheneRunStepStats(stats[0]))
         return GrapheneSolidStepStatsConnection(nodes=nodes)
@@ -614,13 +674,9 @@ class Meta:
         name = "CompositeSolidDefinition"
 
     def __init__(self, represented_pipeline, solid_def_name):
-        self._represented_pipeline = check.inst_param(
-            represented_pipeline, "represented_pipeline", RepresentedPipeline
-        )
-        self._solid_def_snap = represented_pipeline.get_node_def_snap(solid_def_name)
+        ISolidDefinitionMixin.__init__(self, represented_pipeline, solid_def_name)
         self._comp_solid_dep_index = represented_pipeline.get_dep_structure_index(solid_def_name)
         super().__init__(name=solid_def_name, description=self._solid_def_snap.description)
-        ISolidDefinitionMixin.__init__(self, represented_pipeline, solid_def_name)
 
     def resolve_id(self, _graphene_info):
         return f"{self._represented_pipeline.identifying_pipeline_snapshot_id}:{self._solid_def_snap.name}"
@@ -654,19 +710,7 @@ def resolve_solid_handle(self, _graphene_info, handleID):
         return build_solid_handles(self._represented_pipeline).get(handleID)
 
     def resolve_solid_handles(self, _graphene_info, **kwargs):
-        handles = build_solid_handles(self._represented_pipeline)
-        parentHandleID = kwargs.get("parentHandleID")
-
-        if parentHandleID == "":
-            handles = {key: handle for key, handle in handles.items() if not handle.parent}
-        elif parentHandleID is not None:
-            handles = {
-                key: handle
-                for key, handle in handles.items()
-                if handle.parent and handle.parent.handleID.to_string() == parentHandleID
-            }
-
-        return [handles[key] for key in sorted(handles)]
+        return build_sorted_solid_handles(self._represented_pipeline, kwargs.get("parentHandleID"))
 
     def resolve_modes(self, _graphene_info):
         # returns empty list... composite solids don't have modes, this is a vestige of the old
@@ -674,6 +718,7 @@ def resolve_modes(self, _graphene_info):
         return []
 
 
+@_memoize_on_pipeline
 def build_solid_definition(represented_pipeline, solid_def_name):
     check.inst_param(represented_pipeline, "represented_pipeline", RepresentedPipeline)
     check.str_param(solid_def_name, "solid_def_name")
@@ -1,5 +1,19 @@
+import gc
+import weakref
+
+from dagster_graphql.schema.solids import (
+    build_input_definition,
+    build_output_definition,
+    build_solid,
+    build_solid_definition,
+    build_solid_handles,
+)
 from dagster_graphql.test.utils import execute_dagster_graphql, infer_repository_selector
 
+from dagster import In, Out, job, op
+from dagster.core.host_representation import HistoricalPipeline
+from dagster.core.snap import PipelineSnapshot, create_pipeline_snapshot_id
+
 INPUT_OUTPUT_DEFINITIONS_QUERY = """
     query InputOutputDefinitionsQuery($repositorySelector: RepositorySelector!) {
         repositoryOrError(repositorySelector: $repositorySelector) {
@@ -32,3 +46,79 @@ def test_query_inputs_outputs(graphql_context, snapshot):
     )
     assert result.data
     snapshot.assert_match(result.data)
+
+
+INPUT_OUTPUT_SOLID_DEFINITION_QUERY = """
+    query InputOutputSolidDefinitionQuery($repositorySelector: RepositorySelector!) {
+        repositoryOrError(repositorySelector: $repositorySelector) {
+           ... on Repository {
+                usedSolid(name: "solid_with_input_output_metadata") {
+                    definition {
+                        inputDefinitions {
+                            solidDefinition {
+                                name
+                            }
+                        }
+                        outputDefinitions {
+                            solidDefinition {
+                                name
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_query_inputs_outputs_solid_definition(graphql_context):
+    selector = infer_repository_selector(graphql_context)
+    result = execute_dagster_graphql(
+        graphql_context,
+        INPUT_OUTPUT_SOLID_DEFINITION_QUERY,
+        variables={"repositorySelector": selector},
+    )
+    assert not result.errors
+    definition = result.data["repositoryOrError"]["usedSolid"]["definition"]
+    assert definition["inputDefinitions"]
+    assert definition["outputDefinitions"]
+    for def_data in definition["inputDefinitions"] + definition["outputDefinitions"]:
+        assert def_data["solidDefinition"]["name"] == "solid_with_input_output_metadata"
+
+
+def _historical_pipeline(pipeline_def):
+    snapshot = PipelineSnapshot.from_pipeline_def(pipeline_def)
+    return HistoricalPipeline(snapshot, create_pipeline_snapshot_id(snapshot), None)
+
+
+def test_definitions_memoized_on_pipeline():
+    @op(ins={"num": In(int)}, out=Out(int))
+    def add_one(num):
+        return num + 1
+
+    @job
+    def add_one_job():
+        add_one()
+
+    pipeline = _historical_pipeline(add_one_job)
+    input_def = build_input_definition(pipeline, "add_one", "num")
+    output_def = build_output_definition(pipeline, "add_one", "result", False)
+    assert build_input_definition(pipeline, "add_one", "num") is input_def
+    assert build_output_definition(pipeline, "add_one", "result", False) is output_def
+    assert build_solid_definition(pipeline, "add_one") is build_solid_definition(
+        pipeline, "add_one"
+    )
+    assert build_solid_handles(pipeline)["add_one"].solid is build_solid(
+        pipeline, "add_one", pipeline.dep_structure_index
+    )
+
+    # a different representation of the same pipeline gets its own objects
+    other_pipeline = _historical_pipeline(add_one_job)
+    assert build_input_definition(other_pipeline, "add_one", "num") is not input_def
+
+    # memoized objects do not keep the pipeline alive once it is released
+    pipeline_ref = weakref.ref(pipeline)
+    del pipeline, input_def, output_def
+    gc.collect()
+    assert pipeline_ref() is None
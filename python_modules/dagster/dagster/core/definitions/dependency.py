@@ -108,6 +108,17 @@ class Node:
     Node invocation within a graph. Identified by its name inside the graph.
     """
 
+    __slots__ = [
+        "name",
+        "definition",
+        "graph_definition",
+        "_additional_tags",
+        "_hook_defs",
+        "_retry_policy",
+        "_input_handles",
+        "_output_handles",
+    ]
+
     def __init__(
         self,
         name: str,
@@ -174,16 +174,15 @@ def _update(self) -> None:
                 # If there is at least one of the step's inputs, none of whose upstream steps has
                 # yielded an output, we should skip that step.
                 for step_input in step.step_inputs:
+                    source_handles = step_input.get_step_output_handle_dependencies()
                     missing_source_handles = [
                         source_handle
-                        for source_handle in step_input.get_step_output_handle_dependencies()
+                        for source_handle in source_handles
                         if source_handle.step_key in requirements
                         and source_handle not in self._step_outputs
                     ]
                     if missing_source_handles:
-                        if len(missing_source_handles) == len(
-                            step_input.get_step_output_handle_dependencies()
-                        ):
+                        if len(missing_source_handles) == len(source_handles):
                             should_skip = True
                             break
 
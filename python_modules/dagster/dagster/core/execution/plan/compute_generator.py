@@ -29,17 +29,20 @@ def create_solid_compute_wrapper(solid_def: SolidDefinition):
         if not input_def.dagster_type.kind == DagsterTypeKind.NOTHING
     ]
 
+    # inspect the decorated function once, rather than on every invocation
+    is_generator_or_coroutine_fn = (
+        inspect.isgeneratorfunction(fn)
+        or inspect.isasyncgenfunction(fn)
+        or inspect.iscoroutinefunction(fn)
+    )
+
     @wraps(fn)
     def compute(context, input_defs) -> Generator[Output, None, None]:
         kwargs = {}
         for input_name in input_names:
             kwargs[input_name] = input_defs[input_name]
 
-        if (
-            inspect.isgeneratorfunction(fn)
-            or inspect.isasyncgenfunction(fn)
-            or inspect.iscoroutinefunction(fn)
-        ):
+        if is_generator_or_coroutine_fn:
             # safe to execute the function, as doing so will not immediately execute user code
             result = fn(context, **kwargs) if context_arg_provided else fn(**kwargs)
             if inspect.iscoroutine(result):
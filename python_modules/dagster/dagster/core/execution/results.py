@@ -18,6 +18,15 @@ def _construct_events_by_step_key(event_list):
     return dict(events_by_step_key)
 
 
+def _construct_step_events_by_solid_handle(event_list):
+    step_events_by_solid_handle = defaultdict(list)
+    for event in event_list:
+        if event.is_step_event:
+            step_events_by_solid_handle[event.solid_handle].append(event)
+
+    return dict(step_events_by_solid_handle)
+
+
 class GraphExecutionResult:
     def __init__(
         self,
@@ -37,6 +46,7 @@ def __init__(
             output_capture, "output_capture", key_type=StepOutputHandle
         )
         self._events_by_step_key = _construct_events_by_step_key(event_list)
+        self._step_events_by_solid_handle = _construct_step_events_by_solid_handle(event_list)
 
     @property
     def success(self):
@@ -120,10 +130,12 @@ def _result_for_handle(self, solid, handle):
                 output_capture=self.output_capture,
             )
         else:
-            for event in self.event_list:
-                if event.is_step_event:
-                    if event.solid_handle.is_or_descends_from(handle.with_ancestor(self.handle)):
-                        events_by_kind[event.step_kind].append(event)
+            # a non-graph solid has no descendants, so its step events are exactly those whose
+            # handle matches its own
+            for event in self._step_events_by_solid_handle.get(
+                handle.with_ancestor(self.handle), []
+            ):
+                events_by_kind[event.step_kind].append(event)
 
             return SolidExecutionResult(
                 solid,
@@ -1,6 +1,6 @@
 import warnings
 from collections import OrderedDict
-from typing import TYPE_CHECKING, List, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
 
 import dagster._check as check
 from dagster.core.definitions.events import AssetKey
@@ -76,14 +76,18 @@ def __init__(
 
         # pylint: disable=unsubscriptable-object
         _asset_jobs: OrderedDict[str, List[ExternalAssetNode]] = OrderedDict()
+        _asset_ops: Dict[str, List[ExternalAssetNode]] = {}
         for asset_node in external_repository_data.external_asset_graph_data:
             for job_name in asset_node.job_names:
                 if job_name not in _asset_jobs:
                     _asset_jobs[job_name] = [asset_node]
                 else:
                     _asset_jobs[job_name].append(asset_node)
+            if asset_node.op_name:
+                _asset_ops.setdefault(asset_node.op_name, []).append(asset_node)
         # pylint: disable=unsubscriptable-object
         self._asset_jobs: OrderedDict[str, Sequence[ExternalAssetNode]] = OrderedDict(_asset_jobs)
+        self._asset_ops: Dict[str, Sequence[ExternalAssetNode]] = _asset_ops
 
     @property
     def name(self):
@@ -203,6 +207,9 @@ def get_external_asset_nodes(self, job_name=None) -> Sequence[ExternalAssetNode]
             else self._asset_jobs.get(job_name, [])
         )
 
+    def get_external_asset_nodes_for_op(self, op_name: str) -> Sequence[ExternalAssetNode]:
+        return self._asset_ops.get(op_name, [])
+
     def get_external_asset_node(self, asset_key: AssetKey) -> Optional[ExternalAssetNode]:
         matching = [
             asset_node
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import dagster._check as check
 from dagster.config.snap import ConfigSchemaSnapshot
@@ -9,7 +9,14 @@
 )
 from dagster.core.snap.dagster_types import DagsterTypeSnap
 from dagster.core.snap.mode import ModeDefSnap
-from dagster.core.snap.solid import CompositeSolidDefSnap, SolidDefSnap
+from dagster.core.snap.solid import (
+    CompositeSolidDefSnap,
+    InputDefSnap,
+    InputMappingSnap,
+    OutputDefSnap,
+    OutputMappingSnap,
+    SolidDefSnap,
+)
 
 
 class PipelineIndex:
@@ -17,6 +24,10 @@ class PipelineIndex:
     pipeline_snapshot: PipelineSnapshot
     parent_pipeline_snapshot: Optional[PipelineSnapshot]
     _node_defs_snaps_index: Dict[str, Union[SolidDefSnap, CompositeSolidDefSnap]]
+    _input_def_snaps_index: Optional[Dict[Tuple[str, str], InputDefSnap]]
+    _output_def_snaps_index: Optional[Dict[Tuple[str, str], OutputDefSnap]]
+    _input_mapping_snaps_index: Optional[Dict[Tuple[str, str], InputMappingSnap]]
+    _output_mapping_snaps_index: Optional[Dict[Tuple[str, str], OutputMappingSnap]]
     _dagster_type_snaps_by_name_index: Dict[str, DagsterTypeSnap]
     dep_structure_index: DependencyStructureIndex
     _comp_dep_structures: Dict[str, DependencyStructureIndex]
@@ -46,6 +57,12 @@ def __init__(
         ]
         self._node_defs_snaps_index = {sd.name: sd for sd in node_def_snaps}
 
+        # keyed on (node def name, input/output name), built on first use
+        self._input_def_snaps_index = None
+        self._output_def_snaps_index = None
+        self._input_mapping_snaps_index = None
+        self._output_mapping_snaps_index = None
+
         self._dagster_type_snaps_by_name_index = {
             dagster_type_snap.name: dagster_type_snap
             for dagster_type_snap in pipeline_snapshot.dagster_type_namespace_snapshot.all_dagster_type_snaps_by_key.values()
@@ -95,6 +112,72 @@ def get_node_def_snap(self, node_def_name: str) -> Union[SolidDefSnap, Composite
         check.str_param(node_def_name, "node_def_name")
         return self._node_defs_snaps_index[node_def_name]
 
+    # The lookups below fall back to the snap's own lookup for unknown names so that callers get
+    # the same error as when looking up through the snap directly
+
+    def get_input_def_snap(self, node_def_name: str, input_name: str) -> InputDefSnap:
+        if self._input_def_snaps_index is None:
+            self._input_def_snaps_index = {
+                (sd.name, input_def_snap.name): input_def_snap
+                for sd in self._node_defs_snaps_index.values()
+                for input_def_snap in sd.input_def_snaps
+            }
+
+        input_def_snap = self._input_def_snaps_index.get((node_def_name, input_name))
+        if input_def_snap is None:
+            return self.get_node_def_snap(node_def_name).get_input_snap(input_name)
+        return input_def_snap
+
+    def get_output_def_snap(self, node_def_name: str, output_name: str) -> OutputDefSnap:
+        if self._output_def_snaps_index is None:
+            self._output_def_snaps_index = {
+                (sd.name, output_def_snap.name): output_def_snap
+                for sd in self._node_defs_snaps_index.values()
+                for output_def_snap in sd.output_def_snaps
+            }
+
+        output_def_snap = self._output_def_snaps_index.get((node_def_name, output_name))
+        if output_def_snap is None:
+            return self.get_node_def_snap(node_def_name).get_output_snap(output_name)
+        return output_def_snap
+
+    def get_input_mapping_snap(self, comp_solid_def_name: str, input_name: str) -> InputMappingSnap:
+        if self._input_mapping_snaps_index is None:
+            self._input_mapping_snaps_index = {
+                (comp_snap.name, input_mapping_snap.external_input_name): input_mapping_snap
+                for comp_snap in self._composite_solid_def_snaps()
+                for input_mapping_snap in comp_snap.input_mapping_snaps
+            }
+
+        input_mapping_snap = self._input_mapping_snaps_index.get((comp_solid_def_name, input_name))
+        if input_mapping_snap is None:
+            comp_solid_def_snap = self.get_node_def_snap(comp_solid_def_name)
+            check.inst(comp_solid_def_snap, CompositeSolidDefSnap)
+            return comp_solid_def_snap.get_input_mapping_snap(input_name)  # type: ignore
+        return input_mapping_snap
+
+    def get_output_mapping_snap(
+        self, comp_solid_def_name: str, output_name: str
+    ) -> OutputMappingSnap:
+        if self._output_mapping_snaps_index is None:
+            self._output_mapping_snaps_index = {
+                (comp_snap.name, output_mapping_snap.external_output_name): output_mapping_snap
+                for comp_snap in self._composite_solid_def_snaps()
+                for output_mapping_snap in comp_snap.output_mapping_snaps
+            }
+
+        output_mapping_snap = self._output_mapping_snaps_index.get(
+            (comp_solid_def_name, output_name)
+        )
+        if output_mapping_snap is None:
+            comp_solid_def_snap = self.get_node_def_snap(comp_solid_def_name)
+            check.inst(comp_solid_def_snap, CompositeSolidDefSnap)
+            return comp_solid_def_snap.get_output_mapping_snap(output_name)  # type: ignore
+        return output_mapping_snap
+
+    def _composite_solid_def_snaps(self) -> List[CompositeSolidDefSnap]:
+        return self.pipeline_snapshot.solid_definitions_snapshot.composite_solid_def_snaps
+
     def get_dep_structure_index(self, comp_solid_def_name: str) -> DependencyStructureIndex:
         return self._comp_dep_structures[comp_solid_def_name]
 
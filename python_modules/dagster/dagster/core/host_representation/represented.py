@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import AbstractSet, List, Optional, Union
+from typing import AbstractSet, Any, Callable, Dict, Hashable, List, Optional, TypeVar, Union
 
 import dagster._check as check
 from dagster.config.snap import ConfigSchemaSnapshot
@@ -7,10 +7,19 @@
 from dagster.core.snap.dep_snapshot import DependencyStructureIndex
 from dagster.core.snap.mode import ModeDefSnap
 from dagster.core.snap.pipeline_snapshot import PipelineSnapshot
-from dagster.core.snap.solid import CompositeSolidDefSnap, SolidDefSnap
+from dagster.core.snap.solid import (
+    CompositeSolidDefSnap,
+    InputDefSnap,
+    InputMappingSnap,
+    OutputDefSnap,
+    OutputMappingSnap,
+    SolidDefSnap,
+)
 
 from .pipeline_index import PipelineIndex
 
+T = TypeVar("T")
+
 
 class RepresentedPipeline(ABC):
     """
@@ -25,6 +34,14 @@ class RepresentedPipeline(ABC):
 
     def __init__(self, pipeline_index):
         self._pipeline_index = check.inst_param(pipeline_index, "pipeline_index", PipelineIndex)
+        self._memo: Dict[Hashable, Any] = {}
+
+    # Lets hosts share views derived from this pipeline (e.g. dagit's graphql objects) for as long
+    # as this representation is alive, without keeping it alive in a process-wide cache.
+    def get_memoized(self, key: Hashable, build_fn: Callable[[], T]) -> T:
+        if key not in self._memo:
+            self._memo[key] = build_fn()
+        return self._memo[key]
 
     # Temporary method to allow for incrementally
     # replacing pipeline index with the representation hierarchy
@@ -114,6 +131,26 @@ def get_node_def_snap(self, solid_def_name: str) -> Union[SolidDefSnap, Composit
         check.str_param(solid_def_name, "solid_def_name")
         return self._pipeline_index.get_node_def_snap(solid_def_name)
 
+    def get_input_def_snap(self, solid_def_name: str, input_name: str) -> InputDefSnap:
+        check.str_param(solid_def_name, "solid_def_name")
+        check.str_param(input_name, "input_name")
+        return self._pipeline_index.get_input_def_snap(solid_def_name, input_name)
+
+    def get_output_def_snap(self, solid_def_name: str, output_name: str) -> OutputDefSnap:
+        check.str_param(solid_def_name, "solid_def_name")
+        check.str_param(output_name, "output_name")
+        return self._pipeline_index.get_output_def_snap(solid_def_name, output_name)
+
+    def get_input_mapping_snap(self, solid_def_name: str, input_name: str) -> InputMappingSnap:
+        check.str_param(solid_def_name, "solid_def_name")
+        check.str_param(input_name, "input_name")
+        return self._pipeline_index.get_input_mapping_snap(solid_def_name, input_name)
+
+    def get_output_mapping_snap(self, solid_def_name: str, output_name: str) -> OutputMappingSnap:
+        check.str_param(solid_def_name, "solid_def_name")
+        check.str_param(output_name, "output_name")
+        return self._pipeline_index.get_output_mapping_snap(solid_def_name, output_name)
+
     def get_dep_structure_index(self, solid_def_name: str) -> DependencyStructureIndex:
         check.str_param(solid_def_name, "solid_def_name")
         return self._pipeline_index.get_dep_structure_index(solid_def_name)
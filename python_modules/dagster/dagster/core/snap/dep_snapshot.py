@@ -91,6 +91,13 @@ def __init__(self, dep_structure_snapshot):
         self._invocations_dict = {
             si.solid_name: si for si in dep_structure_snapshot.solid_invocation_snaps
         }
+        self._input_to_upstream_index = {
+            si.solid_name: {
+                input_dep_snap.input_name: input_dep_snap.upstream_output_snaps
+                for input_dep_snap in si.input_dep_snaps
+            }
+            for si in dep_structure_snapshot.solid_invocation_snaps
+        }
         self._output_to_upstream_index = self._build_index(
             dep_structure_snapshot.solid_invocation_snaps
         )
@@ -131,9 +138,9 @@ def get_upstream_outputs(self, solid_name, input_name):
         check.str_param(solid_name, "solid_name")
         check.str_param(input_name, "input_name")
 
-        for input_dep_snap in self.get_invocation(solid_name).input_dep_snaps:
-            if input_dep_snap.input_name == input_name:
-                return input_dep_snap.upstream_output_snaps
+        upstream_outputs_by_input = self._input_to_upstream_index[solid_name]
+        if input_name in upstream_outputs_by_input:
+            return upstream_outputs_by_input[input_name]
 
         check.failed(
             "Input {input_name} not found for solid {solid_name}".format(
@@ -7,6 +7,24 @@
 
 from .merger import deep_merge_dicts
 
+try:
+    # prefer the libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as FastSafeLoader
+except ImportError:
+    from yaml import SafeLoader as FastSafeLoader  # type: ignore
+
+
+def _safe_load(yaml_str: str) -> object:
+    try:
+        return yaml.load(yaml_str, Loader=FastSafeLoader)
+    except yaml.YAMLError:
+        if FastSafeLoader is yaml.SafeLoader:
+            raise
+        # re-parse with the pure python loader only to surface its more descriptive error message;
+        # if it unexpectedly succeeds, the original error is re-raised rather than its result
+        yaml.safe_load(yaml_str)
+        raise
+
 
 def load_yaml_from_globs(*globs):
     return load_yaml_from_glob_list(list(globs))
@@ -69,7 +87,7 @@ def merge_yaml_strings(yaml_strs):
     check.list_param(yaml_strs, "yaml_strs", of_type=str)
 
     # Read YAML strings.
-    yaml_dicts = list([yaml.safe_load(y) for y in yaml_strs])
+    yaml_dicts = list([_safe_load(y) for y in yaml_strs])
 
     for yaml_dict in yaml_dicts:
         check.invariant(
@@ -83,4 +101,4 @@ def merge_yaml_strings(yaml_strs):
 def load_yaml_from_path(path: str) -> object:
     check.str_param(path, "path")
     with open(path, "r", encoding="utf8") as ff:
-        return yaml.safe_load(ff)
+        return _safe_load(ff.read())
@@ -0,0 +1,50 @@
+import pytest
+
+from dagster import In, Out, graph, op
+from dagster._check import CheckError
+from dagster.core.host_representation.pipeline_index import PipelineIndex
+from dagster.core.snap import PipelineSnapshot
+
+
+@op(ins={"num": In(int)}, out=Out(int))
+def add_one(num):
+    return num + 1
+
+
+@graph
+def add_two(num):
+    return add_one(add_one(num))
+
+
+@graph
+def add_four():
+    add_two(add_two())
+
+
+def test_pipeline_index_snap_lookups():
+    index = PipelineIndex(PipelineSnapshot.from_pipeline_def(add_four.to_job()), None)
+
+    assert index.get_input_def_snap("add_one", "num").name == "num"
+    assert index.get_output_def_snap("add_one", "result").name == "result"
+    assert index.get_input_def_snap("add_two", "num").name == "num"
+    assert index.get_output_def_snap("add_two", "result").name == "result"
+
+    input_mapping_snap = index.get_input_mapping_snap("add_two", "num")
+    assert input_mapping_snap.mapped_solid_name == "add_one"
+    assert input_mapping_snap.mapped_input_name == "num"
+
+    output_mapping_snap = index.get_output_mapping_snap("add_two", "result")
+    assert output_mapping_snap.mapped_solid_name == "add_one_2"
+    assert output_mapping_snap.mapped_output_name == "result"
+
+    with pytest.raises(CheckError, match="Could not find input not_an_input"):
+        index.get_input_def_snap("add_one", "not_an_input")
+
+    with pytest.raises(CheckError, match="Could not find output not_an_output"):
+        index.get_output_def_snap("add_one", "not_an_output")
+
+    with pytest.raises(CheckError, match="Could not find input mapping snap named not_an_input"):
+        index.get_input_mapping_snap("add_two", "not_an_input")
+
+    with pytest.raises(CheckError, match="Could not find output mapping snap named not_an_output"):
+        index.get_output_mapping_snap("add_two", "not_an_output")
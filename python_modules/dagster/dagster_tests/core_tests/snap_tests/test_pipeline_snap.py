@@ -14,6 +14,7 @@
     pipeline,
     solid,
 )
+from dagster._check import CheckError
 from dagster.config.config_type import Array, Bool, Enum, EnumValue, Float, Int, Noneable, String
 from dagster.core.snap import (
     DependencyStructureIndex,
@@ -153,6 +154,9 @@ def single_dep_pipeline():
     assert outputs[0].solid_name == "return_one"
     assert outputs[0].output_name == "result"
 
+    with pytest.raises(CheckError, match="Input not_an_input not found for solid passthrough"):
+        index.get_upstream_outputs("passthrough", "not_an_input")
+
 
 def test_basic_dep_fan_out(snapshot):
     @solid
@@ -6,7 +6,11 @@
 from dagster.core.test_utils import environ
 from dagster.utils.merger import merge_dicts
 
-from .secrets import construct_secretsmanager_client, get_secrets_from_arns, get_tagged_secrets
+from .secrets import (
+    construct_secretsmanager_client,
+    get_secret_values_from_arns,
+    get_tagged_secrets,
+)
 
 SECRETSMANAGER_SESSION_CONFIG = {
     "region_name": Field(
@@ -198,14 +202,12 @@ def example_job():
         profile_name=context.resource_config.get("profile_name"),
     )
 
-    secret_arns = merge_dicts(
-        (get_tagged_secrets(secrets_manager, [secrets_tag]) if secrets_tag else {}),
-        get_secrets_from_arns(secrets_manager, secrets),
-    )
-
-    secrets_map = {
-        name: secrets_manager.get_secret_value(SecretId=arn).get("SecretString")
-        for name, arn in secret_arns.items()
-    }
+    # Explicitly listed secrets come last so that they take precedence over tagged secrets
+    # with the same name
+    secret_arns = [
+        *(get_tagged_secrets(secrets_manager, [secrets_tag]).values() if secrets_tag else []),
+        *secrets,
+    ]
+    secrets_map = get_secret_values_from_arns(secrets_manager, secret_arns)
     with environ(secrets_map if add_to_environment else {}):
         yield secrets_map
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Sequence
 
 import boto3
@@ -6,6 +7,9 @@
 
 from ..utils import construct_boto_client_retry_config
 
+LIST_SECRETS_PAGE_SIZE = 100
+MAX_SECRET_FETCH_WORKERS = 16
+
 
 def construct_secretsmanager_client(
     max_attempts: int, region_name: Optional[str] = None, profile_name: Optional[str] = None
@@ -40,6 +44,8 @@ def get_tagged_secrets(secrets_manager, secrets_tags: Sequence[str]) -> Dict[str
                     "Values": [secrets_tag],
                 },
             ],
+            # request the largest page ListSecrets allows to minimize round trips
+            PaginationConfig={"PageSize": LIST_SECRETS_PAGE_SIZE},
         ):
             for secret in page["SecretList"]:
                 secrets[secret["Name"]] = secret["ARN"]
@@ -52,9 +58,35 @@ def get_secrets_from_arns(secrets_manager, secret_arns: List[str]) -> Dict[str,
     Return a dictionary of AWS Secrets Manager names to arns.
     """
 
-    secrets = {}
-    for arn in secret_arns:
-        name = secrets_manager.describe_secret(SecretId=arn)["Name"]
-        secrets[name] = arn
+    descriptions = _map_secret_requests(
+        lambda arn: secrets_manager.describe_secret(SecretId=arn), secret_arns
+    )
+    return {description["Name"]: arn for description, arn in zip(descriptions, secret_arns)}
 
-    return secrets
+
+def get_secret_values_from_arns(
+    secrets_manager, secret_arns: Sequence[str]
+) -> Dict[str, Optional[str]]:
+    """
+    Return a dictionary of AWS Secrets Manager names to secret string values. Binary secrets
+    map to None.
+    """
+
+    # GetSecretValue also returns the secret's name, so no DescribeSecret call is needed. A secret
+    # that is both tagged and listed explicitly only needs to be fetched once.
+    secret_values = _map_secret_requests(
+        lambda arn: secrets_manager.get_secret_value(SecretId=arn), list(dict.fromkeys(secret_arns))
+    )
+    return {secret["Name"]: secret.get("SecretString") for secret in secret_values}
+
+
+def _map_secret_requests(request_fn, secret_arns: Sequence[str]) -> List[dict]:
+    # Each request is a separate round trip, so issue them concurrently. boto3 clients are safe to
+    # share across threads. Results are returned in the order of secret_arns.
+    if not secret_arns:
+        return []
+
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_SECRET_FETCH_WORKERS, len(secret_arns))
+    ) as executor:
+        return list(executor.map(request_fn, secret_arns))
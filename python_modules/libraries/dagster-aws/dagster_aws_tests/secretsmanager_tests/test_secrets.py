@@ -1,8 +1,9 @@
 import json
 import os
+from unittest import mock
 
 from dagster_aws.secretsmanager import get_secrets_from_arns, secretsmanager_secrets_resource
-from dagster_aws.secretsmanager.secrets import get_tagged_secrets
+from dagster_aws.secretsmanager.secrets import get_secret_values_from_arns, get_tagged_secrets
 
 from dagster.core.execution.context.init import build_init_resource_context
 from dagster.core.test_utils import environ
@@ -31,6 +32,29 @@ def test_get_secrets_from_arns(mock_secretsmanager_resource):
     }
 
 
+def test_get_secret_values_from_arns(mock_secretsmanager_resource):
+    foo_secret = mock_secretsmanager_resource.create_secret(
+        Name="foo_secret", SecretString="foo_value"
+    )
+    binary_secret = mock_secretsmanager_resource.create_secret(
+        Name="binary_secret", SecretBinary=b"binary_value"
+    )
+    assert get_secret_values_from_arns(mock_secretsmanager_resource, []) == {}
+    assert get_secret_values_from_arns(
+        mock_secretsmanager_resource, [foo_secret["ARN"], binary_secret["ARN"]]
+    ) == {"foo_secret": "foo_value", "binary_secret": None}
+
+    with mock.patch.object(
+        mock_secretsmanager_resource,
+        "get_secret_value",
+        wraps=mock_secretsmanager_resource.get_secret_value,
+    ) as get_secret_value:
+        assert get_secret_values_from_arns(
+            mock_secretsmanager_resource, [foo_secret["ARN"], foo_secret["ARN"]]
+        ) == {"foo_secret": "foo_value"}
+        assert get_secret_value.call_count == 1
+
+
 def test_get_tagged_secrets(mock_secretsmanager_resource):
     assert get_tagged_secrets(mock_secretsmanager_resource, ["dagster"]) == {}
 
@@ -1,14 +1,17 @@
-from typing import Dict
+import re
 
 from setuptools import find_packages, setup
 
 
 def get_version() -> str:
-    version: Dict[str, str] = {}
+    # read the version string directly instead of executing version.py
     with open("dagster_databricks/version.py", encoding="utf8") as fp:
-        exec(fp.read(), version)  # pylint: disable=W0122
+        match = re.search(r"^__version__\s*=\s*[\"']([^\"']+)[\"']", fp.read(), re.M)
 
-    return version["__version__"]
+    if not match:
+        raise RuntimeError("Unable to find __version__ in dagster_databricks/version.py")
+
+    return match.group(1)
 
 
 if __name__ == "__main__":